@@ -1,24 +1,438 @@
 #!/usr/bin/env python3
 
 import os
+import io
+import hashlib
+import json
 import gc
+import re
+import threading
+import zipfile
 import numpy as np
 import xarray as xr
+import netCDF4
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+# Let Agg render long paths (coastlines, gridlines) in chunks
+matplotlib.rcParams['agg.path.chunksize'] = 10000
+from PIL import Image
+from matplotlib.figure import Figure
+from matplotlib.cm import ScalarMappable
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import cartopy.crs as ccrs
 from pathlib import Path
-import dask
-from scipy.interpolate import griddata
+from scipy.spatial import Delaunay, cKDTree
 from typing import Dict, List, Tuple
-from dask.diagnostics import ProgressBar
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from tqdm import tqdm
 import argparse
 import psutil
 import sys
+from numba import njit, prange, get_num_threads, set_num_threads
+
+# Optional fpng based PNG encoder, several times faster than Pillow's zlib
+try:
+    import pyfpng
+except ImportError:
+    pyfpng = None
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _interp_gather(vertices, weights, values, fill_value, out):
+    """Evaluate out[q] = sum_j weights[q, j] * values[vertices[q, j]].
+    
+    Target points with vertices[q, 0] < 0 lie outside the source grid and are
+    set to fill_value.
+    """
+    for q in prange(vertices.shape[0]):
+        if vertices[q, 0] < 0:
+            out[q] = fill_value
+        else:
+            acc = 0.0
+            for j in range(vertices.shape[1]):
+                acc += weights[q, j] * values[vertices[q, j]]
+            out[q] = acc
+
+@njit(parallel=True, cache=True)
+def _scrub_f32(x, out):
+    """Write x to the float32 array out with NaNs and infinities replaced by zero.
+    
+    The range of the finite values is gathered in the same pass. Not compiled
+    with fastmath, which would let LLVM drop the NaN check.
+    
+    Returns:
+        Tuple of (number of values replaced, min, max of the finite values);
+        the min and max are inf and -inf if there are none
+    """
+    n_invalid = 0
+    v_min = np.inf
+    v_max = -np.inf
+    for i in prange(x.size):
+        v = x[i]
+        if np.isfinite(v):
+            out[i] = v
+            v_min = min(v_min, v)
+            v_max = max(v_max, v)
+        else:
+            out[i] = 0.0
+            n_invalid += 1
+    return n_invalid, v_min, v_max
+
+# Experiment name of an image: the file name prefix before the first common
+# flux variable name
+_EXPERIMENT_NAME_RE = re.compile(r'^(?P<exp>.+?)_(?:sst|prec|A)_')
+
+# Static parts of the HTML reports, filled in by generate_html_single and
+# generate_html_comparison. The styles and scripts are written to separate
+# files next to the page, see _write_html_assets.
+_HTML_HEAD_FMT = '''<!DOCTYPE html>
+<html>
+<head>
+<title>{title}</title>
+<link rel="stylesheet" href="style.css">
+<link rel="stylesheet" href="{page_style}">
+</head>
+<body>
+'''
+
+# Styles shared by both pages (style.css)
+_HTML_BASE_STYLE = '''    body {
+        font-family: Arial, sans-serif;
+        background-color: #f5f5f5;
+        margin: 0;
+        padding: 20px;
+    }
+    .stats {
+        background: white;
+        padding: 15px;
+        border-radius: 5px;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        margin-top: 20px;
+    }
+    .toggle {
+        cursor: pointer;
+        color: #06c;
+        text-decoration: underline;
+    }
+    .skipped-list {
+        display: none;
+        margin-top: 10px;
+        padding: 10px;
+        background: #fff;
+        border: 1px solid #ddd;
+    }
+    /* Tab styles */
+    .tab {
+        overflow: hidden;
+        border: 1px solid #ccc;
+        background-color: #f1f1f1;
+        margin-bottom: 20px;
+    }
+    .tab button {
+        background-color: inherit;
+        float: left;
+        border: none;
+        outline: none;
+        cursor: pointer;
+        padding: 14px 16px;
+        transition: 0.3s;
+        font-size: 16px;
+    }
+    .tab button:hover {
+        background-color: #ddd;
+    }
+    .tab button.active {
+        background-color: #ccc;
+    }
+    .tabcontent {
+        display: none;
+        padding: 6px 12px;
+        border: 1px solid #ccc;
+        border-top: none;
+    }
+'''
+
+# Styles of the single folder page (single.css)
+_HTML_SINGLE_STYLE = '''    h1, h2 {
+        color: #333;
+    }
+    h1 {
+        border-bottom: 1px solid #ccc;
+        padding-bottom: 10px;
+    }
+    .single-view {
+        display: flex;
+        flex-direction: column;
+        gap: 20px;
+        align-items: center;
+    }
+    .plot-item {
+        background: white;
+        padding: 15px;
+        border-radius: 5px;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        width: 80%;
+        max-width: 900px;
+        text-align: center;
+    }
+    img {
+        max-width: 100%;
+        height: auto;
+        border: 1px solid #ddd;
+    }
+'''
+
+# Styles of the comparison page (comparison.css)
+_HTML_COMPARISON_STYLE = '''    h1 {
+        color: #333;
+        border-bottom: 1px solid #ccc;
+        padding-bottom: 10px;
+    }
+    h2 {
+        color: #444;
+        margin-top: 5px;
+    }
+    .comparison {
+        display: flex;
+        flex-direction: column;
+        gap: 20px;
+    }
+    .pair {
+        display: flex;
+        gap: 20px;
+        background: white;
+        padding: 15px;
+        border-radius: 5px;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    }
+    .pair > div {
+        flex: 1;
+    }
+    img {
+        width: 100%;
+        height: auto;
+        border: 1px solid #ddd;
+    }
+'''
+
+_HTML_TABS_FMT = '''<div class="tab">
+    <button class="tablinks active" onclick="openPlotType(event, 'NativeGridPlots')">Native Grid</button>
+    <button class="tablinks" onclick="openPlotType(event, 'RemappedPlots')">Remapped</button>
+</div>
+
+<div id="NativeGridPlots" class="tabcontent" style="display: block;">
+    <h1>{heading}</h1>
+    <div class="{view}">
+'''
+
+_HTML_MID_FMT = '''
+    </div>
+</div>
+
+<div id="RemappedPlots" class="tabcontent">
+    <h1>{heading}</h1>
+    <div class="{view}">
+'''
+
+_HTML_NO_PLOTS_FMT = '''
+        <div class="pair">
+            <div>
+                <h2>No {kind} plots available</h2>
+            </div>
+        </div>
+'''
+
+_HTML_FOOTER_FMT = '''
+    </div>
+</div>
+
+<div class="stats">
+    <p>Files plotted: {plotted}, Files skipped: {skipped}</p>
+    <span class="toggle" onclick="toggleSkippedList()">Show/hide skipped files</span>
+    <div id="skippedList" class="skipped-list">
+        <ul>
+            {skipped_files_html}
+        </ul>
+    </div>
+</div>
+
+<script src="tabs.js"></script>
+</body>
+</html>'''
+
+# Tab switching and the skipped files toggle of both pages (tabs.js)
+_HTML_TABS_JS = '''function openPlotType(evt, plotType) {
+    var i, tabcontent, tablinks;
+    tabcontent = document.getElementsByClassName("tabcontent");
+    for (i = 0; i < tabcontent.length; i++) {
+        tabcontent[i].style.display = "none";
+    }
+    tablinks = document.getElementsByClassName("tablinks");
+    for (i = 0; i < tablinks.length; i++) {
+        tablinks[i].className = tablinks[i].className.replace(" active", "");
+    }
+    document.getElementById(plotType).style.display = "block";
+    evt.currentTarget.className += " active";
+}
+
+function toggleSkippedList() {
+    var list = document.getElementById("skippedList");
+    if (list.style.display === "block") {
+        list.style.display = "none";
+    } else {
+        list.style.display = "block";
+    }
+}
+'''
+
+@njit(cache=True)
+def _count_nan(x):
+    """Return the number of NaNs in x without allocating a mask."""
+    n = 0
+    for i in range(x.size):
+        if np.isnan(x[i]):
+            n += 1
+    return n
+
+@njit(parallel=True, cache=True)
+def _finite_range(x):
+    """Return the number of non-finite values and the min and max of the finite ones.
+    
+    A single pass replaces separate isfinite, sum, nanmin and nanmax passes.
+    The min and max are inf and -inf if x has no finite values.
+    """
+    n_invalid = 0
+    v_min = np.inf
+    v_max = -np.inf
+    for i in prange(x.size):
+        v = x[i]
+        if np.isfinite(v):
+            v_min = min(v_min, v)
+            v_max = max(v_max, v)
+        else:
+            n_invalid += 1
+    return n_invalid, v_min, v_max
+
+@njit(cache=True)
+def _pack_valid(lon, lat, data, points, values):
+    """Copy the coordinates and values of the non-NaN points of data in one pass.
+    
+    points receives (lon, lat) pairs and values the data, both packed at the
+    front.
+    
+    Returns:
+        Number of points written
+    """
+    k = 0
+    for i in range(data.size):
+        v = data[i]
+        if not np.isnan(v):
+            points[k, 0] = lon[i]
+            points[k, 1] = lat[i]
+            values[k] = v
+            k += 1
+    return k
+
+# Upper bound of the per-thread partial grids used by _bin_points
+_MAX_BIN_THREADS = 8
+
+@njit(parallel=True, cache=True)
+def _bin_points(lon, lat, values, nx, ny, n_chunks, out):
+    """Average points into the ny x nx bins of the global lon/lat extent.
+    
+    Each of the n_chunks threads accumulates a contiguous range of points
+    into its own partial grid, and the partial grids are reduced afterwards,
+    so no atomics are needed. Empty bins are set to NaN.
+    """
+    n_bins = nx * ny
+    sums = np.zeros((n_chunks, n_bins))
+    counts = np.zeros((n_chunks, n_bins), dtype=np.int32)
+    chunk = (lon.size + n_chunks - 1) // n_chunks
+    for c in prange(n_chunks):
+        for i in range(c * chunk, min(lon.size, (c + 1) * chunk)):
+            ix = min(max(int((lon[i] + 180.0) * (nx / 360.0)), 0), nx - 1)
+            iy = min(max(int((lat[i] + 90.0) * (ny / 180.0)), 0), ny - 1)
+            k = iy * nx + ix
+            sums[c, k] += values[i]
+            counts[c, k] += 1
+    for k in prange(n_bins):
+        total = 0.0
+        n = 0
+        for c in range(n_chunks):
+            total += sums[c, k]
+            n += counts[c, k]
+        out[k] = total / n if n > 0 else np.nan
+
+def _morton_order(ny, nx):
+    """Return the indices of a row-major (ny, nx) grid sorted along a Z-order curve.
+    
+    Consecutive points of the curve are neighbours in both directions, so
+    point location queries visit the same simplices and tree leaves in turn.
+    """
+    def spread_bits(v):
+        # Insert a zero bit after each of the lower 32 bits
+        v = v.astype(np.uint64)
+        for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF),
+                            (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333),
+                            (1, 0x5555555555555555)):
+            v = (v | (v << np.uint64(shift))) & np.uint64(mask)
+        return v
+    
+    rows, cols = np.divmod(np.arange(ny * nx), nx)
+    return np.argsort(spread_bits(rows) << np.uint64(1) | spread_bits(cols), kind='stable')
+
+# Pillow format name and fastest sensible encoder settings of each image format
+_IMAGE_FORMATS = {
+    'png': ('PNG', {'compress_level': 1}),
+    'webp': ('WEBP', {'quality': 85, 'method': 0}),
+}
+
+def _write_image(img, path, image_format='png'):
+    """Encode a PIL image in memory and write it with a single write call.
+    
+    Writing through the buffered io layer issues many small writes, which is
+    slow on the network file systems of HPC machines. PNGs are encoded with
+    pyfpng if it is installed, otherwise with Pillow.
+    
+    Args:
+        img: PIL image
+        path: Output path
+        image_format: Key of _IMAGE_FORMATS
+    """
+    data = None
+    if image_format == 'png' and pyfpng is not None:
+        success, encoded = pyfpng.encode_image_to_memory(np.asarray(img))
+        if success:
+            data = memoryview(encoded)
+    if data is None:
+        pil_format, options = _IMAGE_FORMATS[image_format]
+        buf = io.BytesIO()
+        img.save(buf, format=pil_format, **options)
+        data = buf.getbuffer()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+        # The images are not read again by this script, keep them out of the page cache
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+# Map projection of the plots and of all plotted data; CRS objects are costly
+# to construct, so a single instance is shared
+_PC = ccrs.PlateCarree()
+
+# Number of files between full garbage collections
+_GC_INTERVAL = 16
+
+# The HDF5 library behind netCDF4 is not thread-safe; the sequential mode reads
+# the next file in a background thread while the main thread may access the
+# remap cache
+_NETCDF_LOCK = threading.Lock()
 
 class FluxPlotter:
-    def __init__(self, base_dir: str, timestep: int = 0, remap_higher_res: bool = False, resolution: float = 0.5, parallel: bool = True, verbose: bool = False):
+    def __init__(self, base_dir: str, timestep: int = 0, remap_higher_res: bool = False, resolution: float = 0.5, parallel: bool = True, verbose: bool = False, interp: str = 'linear', dpi: int = 150, image_format: str = 'png'):
         """Initialize the FluxPlotter.
         
         Args:
@@ -28,48 +442,96 @@ class FluxPlotter:
             resolution: Target resolution in degrees (0.5 for half-degree, 0.25 for quarter-degree)
             parallel: Whether to process files in parallel (True) or sequentially (False)
             verbose: Whether to print verbose debug information (default: False)
+            interp: Remapping method, 'linear' (Delaunay, default), 'fast'
+                (inverse distance weighting of the 3 nearest neighbours) or
+                'nearest' (nearest neighbour)
+            dpi: Resolution of the saved plots in dots per inch (default 150,
+                sharp enough for the HTML reports)
+            image_format: Format of the saved plots, 'png' (default) or 'webp'
+                (faster to encode and smaller)
         """
         self.base_dir = Path(base_dir)
         self.output_dir = self.base_dir / 'output'
         self.output_dir.mkdir(exist_ok=True)
         self.image_dir = self.output_dir / 'images'
         self.image_dir.mkdir(parents=True, exist_ok=True)
+        self.thumb_dir = self.image_dir / 'thumbs'
+        self.thumb_dir.mkdir(exist_ok=True)
         self.timestep = timestep
         self.remap_higher_res = remap_higher_res
         self.resolution = resolution
         self.parallel = parallel
         self.verbose = verbose
+        self.interp = interp
+        self.dpi = dpi
+        self.image_format = image_format
         self.skipped_files = []
         self.plotted_files = []
+        # Images written by process_folder, used by generate_html
+        self.image_files = []
+        # Coordinates of the grids in the folder being processed, keyed by coord_type
+        self._coord_cache = {}
+        # Content digests of the grids in _coord_cache, keyed by coord_type
+        self._grid_keys = {}
+        # Interpolation weights of the target grid, keyed by (grid_key, number of points)
+        self._interp_cache = {}
+        # Reusable figure, axes and colorbar, see _get_figure
+        self._fig = self._ax = self._cbar = None
+        # Tight crop box of the reusable figure with a visible colorbar
+        self._bbox = None
+        # psutil handle of this process, created on first use by print_memory_usage
+        self._psutil_proc = None
+        # Files without a data variable found in earlier runs, see _file_key
+        self._skip_cache_path = self.output_dir / 'skip_cache.json'
+        self._skip_cache = self._load_skip_cache()
         
         # Pre-initialize the remapping grid for higher resolution plotting
         if self.remap_higher_res:
             self.print_memory_usage("Before initializing target grid")
             # Creating target grid for higher resolution plotting (0.5 by default)
             # Use -180 to 180 longitude range for better visualization
-            self.target_lon = np.arange(-180, 180, self.resolution)
-            self.target_lat = np.arange(-90, 90, self.resolution)
-            self.target_lon_mesh, self.target_lat_mesh = np.meshgrid(self.target_lon, self.target_lat)
+            self.target_lon = np.arange(-180, 180, self.resolution, dtype=np.float32)
+            self.target_lat = np.arange(-90, 90, self.resolution, dtype=np.float32)
             self.print_memory_usage("After initializing target grid")
-        
-    def remap_to_higher_res(self, lon, lat, data):
+            # Remapped fields of earlier runs, see _remap_cache_path
+            self.remap_cache_dir = self.output_dir / 'remap_cache'
+            self.remap_cache_dir.mkdir(exist_ok=True)
+            # Interpolation weights of earlier runs, see _get_interp_weights
+            self.weights_dir = self.output_dir / 'weights'
+            self.weights_dir.mkdir(exist_ok=True)
+    
+    def __getstate__(self):
+        """Drop the figure and process handle when sent to a worker process."""
+        state = self.__dict__.copy()
+        state['_fig'] = state['_ax'] = state['_cbar'] = state['_bbox'] = None
+        state['_psutil_proc'] = None
+        return state
+        
+    def remap_to_higher_res(self, lon, lat, data, grid_key=None, check_nan=True):
         """Remap irregular grid data to a higher resolution regular grid.
         
+        The interpolation weights only depend on the source coordinates, so
+        they are computed once per grid_key and reused for every file on that
+        grid.
+        
         Args:
-            lon: Longitude coordinates
+            lon: Longitude coordinates in the range [-180, 180]
             lat: Latitude coordinates
             data: Data values
+            grid_key: Key identifying the source grid, e.g. from grid_digest.
+                If None, the weights are not cached.
+            check_nan: Whether data may contain NaNs, which are left out of the
+                interpolation. Callers that already replaced them pass False to
+                skip the extra pass over the data.
             
         Returns:
             Remapped data array
         """
-        # Flatten input arrays if needed
-        if lon.ndim > 1:
-            lon = lon.flatten()
-        if lat.ndim > 1:
-            lat = lat.flatten()
-        if data.ndim > 1:
-            data = data.flatten()
+        # Flatten input arrays if needed and use float32 throughout (views, no
+        # copies for the float32 arrays process_file passes)
+        lon = np.asarray(lon, dtype=np.float32).ravel()
+        lat = np.asarray(lat, dtype=np.float32).ravel()
+        data = np.asarray(data, dtype=np.float32).ravel()
             
         # Make sure all arrays have the same length
         min_len = min(len(lon), len(lat), len(data))
@@ -77,46 +539,170 @@ class FluxPlotter:
         lat = lat[:min_len]
         data = data[:min_len]
         
-        # Convert longitudes to the range [-180, 180] if they're in [0, 360]
-        if np.any(lon > 180):
-            lon = np.where(lon > 180, lon - 360, lon)
-            
-        # Create points array for interpolation
-        points = np.vstack((lon, lat)).T
-        
-        # Filter out any NaN values
-        valid_mask = ~np.isnan(data)
-        if not np.any(valid_mask):
+        # Count the NaN values, usually there are none
+        n_valid = min_len - _count_nan(data) if check_nan else min_len
+        if n_valid == 0:
             if self.verbose:
                 print("Warning: No valid data points for interpolation")
-            return np.zeros((len(self.target_lat), len(self.target_lon)))
+            return np.zeros((len(self.target_lat), len(self.target_lon)), dtype=np.float32)
             
-        points = points[valid_mask]
-        values = data[valid_mask]
+        if grid_key is None or n_valid < min_len:
+            # The valid points differ from the full grid, so compute weights for
+            # this field only, gathering the valid points in a single pass
+            points = np.empty((n_valid, 2), dtype=np.float32)
+            values = np.empty(n_valid, dtype=np.float32)
+            _pack_valid(lon, lat, data, points, values)
+            vertices, weights = self._compute_interp_weights(points)
+        else:
+            vertices, weights = self._get_interp_weights((grid_key, min_len), lon, lat)
+            values = data
         
         self.print_memory_usage("After filtering invalid points")
         
-        # Use linear interpolation for the remapping
-        remapped_data = griddata(
-            points, 
-            values, 
-            (self.target_lon_mesh, self.target_lat_mesh),
-            method='linear',
-            fill_value=0
-        )
+        remapped_data = np.empty(len(vertices), dtype=np.float32)
+        _interp_gather(vertices, weights, values, 0.0, remapped_data)
+        remapped_data = remapped_data.reshape(len(self.target_lat), len(self.target_lon))
         
-        self.print_memory_usage("After griddata interpolation")
+        self.print_memory_usage("After interpolation")
         
         return remapped_data
     
-    def generate_html(self, comparison_folders=None):
+    def _target_points(self):
+        """Return the (lon, lat) pairs of the target grid in row-major order.
+        
+        The flattened points are only needed while interpolating, so they are
+        built on demand instead of keeping a full meshgrid alive.
+        """
+        return np.column_stack((np.tile(self.target_lon, len(self.target_lat)),
+                                np.repeat(self.target_lat, len(self.target_lon))))
+    
+    @staticmethod
+    def grid_digest(lon, lat) -> str:
+        """Return a digest of the grid coordinates.
+        
+        Experiments usually share their grids, so keying the interpolation
+        weights on the coordinates rather than on the folder lets all folders
+        of a run reuse them.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(lon).data)
+        digest.update(np.ascontiguousarray(lat).data)
+        return digest.hexdigest()
+    
+    def _get_interp_weights(self, key, lon, lat):
+        """Return the cached (vertices, weights) of the target points for a source grid.
+        
+        The weights only depend on the source grid, the interpolation method
+        and the target resolution, so they are also stored in the weights
+        directory and read back by later runs instead of being recomputed.
+        """
+        cached = self._interp_cache.get(key)
+        if cached is None:
+            path = self.weights_dir / f"{self.interp}_{self.resolution}deg_{key[0]}_{key[1]}.npz"
+            cached = self._load_interp_weights(path)
+            if cached is None:
+                if self.verbose:
+                    print(f"Computing {self.interp} interpolation weights for source grid {key[0]}")
+                cached = self._compute_interp_weights(np.column_stack((lon, lat)))
+                self._save_interp_weights(path, cached)
+            self._interp_cache[key] = cached
+        return cached
+    
+    def _load_interp_weights(self, path: Path):
+        """Read (vertices, weights) written by _save_interp_weights, or None if unusable."""
+        try:
+            with np.load(path) as npz:
+                vertices, weights = npz['vertices'], npz['weights']
+        # Missing, truncated (BadZipFile), empty (EOFError) or otherwise damaged files
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            return None
+        if len(vertices) != len(self.target_lat) * len(self.target_lon) or vertices.shape != weights.shape:
+            return None
+        if self.verbose:
+            print(f"Using stored interpolation weights {path.name}")
+        return vertices, weights
+    
+    def _save_interp_weights(self, path: Path, cached):
+        """Store (vertices, weights) for later runs, replacing any older version at once."""
+        vertices, weights = cached
+        tmp_path = path.with_name(f".{path.stem}.{os.getpid()}.tmp.npz")
+        try:
+            np.savez(tmp_path, vertices=vertices, weights=weights)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            if self.verbose:
+                print(f"Could not store interpolation weights {path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    def _compute_interp_weights(self, source_points):
+        """Describe every target point as a weighted sum of source points.
+        
+        For 'linear' interpolation the source grid is triangulated and each
+        target point gets the three vertices of its enclosing simplex and its
+        barycentric coordinates; points outside the grid get vertex -1. For
+        'fast' interpolation the three nearest source points are weighted by
+        inverse distance, and 'nearest' takes the single nearest source point.
+        
+        Args:
+            source_points: Array of shape (n_source, 2) with the lon/lat pairs
+                of the source grid
+        
+        Returns:
+            Tuple of (vertices, weights) arrays of shape (n_target, 3), or
+            (n_target, 1) for 'nearest', int32 and float32
+        """
+        # Query the target points along a Z-order curve for cache locality
+        # and put the results back in row-major order at the end
+        order = _morton_order(len(self.target_lat), len(self.target_lon))
+        target_points = self._target_points()[order]
+        
+        if self.interp == 'nearest':
+            # One source point per target point; all weights are one
+            _, vertices = cKDTree(source_points).query(target_points, k=1, workers=-1)
+            vertices = vertices.astype(np.int32).reshape(-1, 1)
+            weights = np.ones(vertices.shape, dtype=np.float32)
+        elif self.interp == 'fast':
+            tree = cKDTree(source_points)
+            dist, vertices = tree.query(target_points, k=3, workers=-1)
+            weights = 1.0 / (dist + 1e-12)
+            weights /= weights.sum(axis=1, keepdims=True)
+            vertices = vertices.astype(np.int32)
+        else:
+            tri = Delaunay(source_points)
+            simplex = tri.find_simplex(target_points)
+            transform = tri.transform[simplex]
+            bary = np.einsum('ijk,ik->ij', transform[:, :2, :], target_points - transform[:, 2, :])
+            weights = np.column_stack((bary, 1 - bary.sum(axis=1)))
+            vertices = tri.simplices[simplex].astype(np.int32)
+            vertices[simplex < 0] = -1
+        
+        unsorted_vertices = np.empty_like(vertices)
+        unsorted_weights = np.empty(weights.shape, dtype=np.float32)
+        unsorted_vertices[order] = vertices
+        unsorted_weights[order] = weights
+        return unsorted_vertices, unsorted_weights
+    
+    def generate_html(self, comparison_folders=None, image_files=None):
         """Generate an HTML page of plotted files.
         
         This is a dispatcher function that calls the appropriate HTML generation
         function based on the number of folders.
+        
+        Args:
+            comparison_folders: Folders to show, detected from the images if None
+            image_files: Paths of the images to show, e.g. the image_files
+                written by process_folder. If None, the image directory is listed.
         """
-        # Get all image files
-        all_images = list(self.image_dir.glob('*.png'))
+        if image_files is not None:
+            all_images = [Path(image_file) for image_file in image_files]
+        else:
+            # Get all image files of the current format, so plots left over from
+            # runs with another --format do not compete with the current ones;
+            # scandir reports the file type without extra stat calls
+            suffix = f".{self.image_format}"
+            with os.scandir(self.image_dir) as entries:
+                all_images = [Path(entry.path) for entry in entries
+                              if entry.name.endswith(suffix) and entry.is_file()]
         
         # Determine if we're in single folder mode or comparison mode
         if comparison_folders:
@@ -141,135 +727,20 @@ class FluxPlotter:
         if self.verbose:
             print(f"Single folder mode: {folder_name}")
             
-        html_content = f'''<!DOCTYPE html>
-<html>
-<head>
-<title>{folder_name} Flux Visualization</title>
-<style>
-    /* Styles for the single folder HTML */
-    body {{
-        font-family: Arial, sans-serif;
-        background-color: #f5f5f5;
-        margin: 0;
-        padding: 20px;
-    }}
-    h1, h2 {{
-        color: #333;
-    }}
-    h1 {{
-        border-bottom: 1px solid #ccc;
-        padding-bottom: 10px;
-    }}
-    .single-view {{
-        display: flex;
-        flex-direction: column;
-        gap: 20px;
-        align-items: center;
-    }}
-    .plot-item {{
-        background: white;
-        padding: 15px;
-        border-radius: 5px;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        width: 80%;
-        max-width: 900px;
-        text-align: center;
-    }}
-    img {{
-        max-width: 100%;
-        height: auto;
-        border: 1px solid #ddd;
-    }}
-    .stats {{
-        background: white;
-        padding: 15px;
-        border-radius: 5px;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        margin-top: 20px;
-    }}
-    .toggle {{
-        cursor: pointer;
-        color: #06c;
-        text-decoration: underline;
-    }}
-    .skipped-list {{
-        display: none;
-        margin-top: 10px;
-        padding: 10px;
-        background: #fff;
-        border: 1px solid #ddd;
-    }}
-    /* Tab styles */
-    .tab {{
-        overflow: hidden;
-        border: 1px solid #ccc;
-        background-color: #f1f1f1;
-        margin-bottom: 20px;
-    }}
-    .tab button {{
-        background-color: inherit;
-        float: left;
-        border: none;
-        outline: none;
-        cursor: pointer;
-        padding: 14px 16px;
-        transition: 0.3s;
-        font-size: 16px;
-    }}
-    .tab button:hover {{
-        background-color: #ddd;
-    }}
-    .tab button.active {{
-        background-color: #ccc;
-    }}
-    .tabcontent {{
-        display: none;
-        padding: 6px 12px;
-        border: 1px solid #ccc;
-        border-top: none;
-    }}
-</style>
-</head>
-<body>
-<h1>{folder_name} Flux Visualization</h1>
-
-<div class="tab">
-    <button class="tablinks active" onclick="openPlotType(event, 'NativeGridPlots')">Native Grid</button>
-    <button class="tablinks" onclick="openPlotType(event, 'RemappedPlots')">Remapped</button>
-</div>
-
-<div id="NativeGridPlots" class="tabcontent" style="display: block;">
-    <h1>Native Grid Plots</h1>
-    <div class="single-view">
-'''
-        
-        # Create dictionaries to store files by prefix and variable
-        native_grid_files = {}
-        remapped_files = {}
+        self._write_html_assets('single.css', _HTML_SINGLE_STYLE)
+        parts = [_HTML_HEAD_FMT.format(title=f"{folder_name} Flux Visualization",
+                                       page_style='single.css'),
+                 f"<h1>{folder_name} Flux Visualization</h1>\n\n",
+                 _HTML_TABS_FMT.format(heading='Native Grid Plots', view='single-view')]
         
         # Debug: List all files
         if self.verbose:
             print(f"Found {len(all_images)} images in directory: {self.image_dir}")
             
-        # Categorize files
-        for img_file in all_images:
-            file_name = img_file.name
-            if self.verbose:
-                print(f"Processing image file: {file_name}")
-            
-            # Determine if it's remapped or native grid
-            is_remapped = f"_{self.resolution}deg" in file_name
-            
-            # Extract experiment name and variable name
-            if file_name.startswith(f"{folder_name}_"):
-                if is_remapped:
-                    # Extract variable name without resolution suffix
-                    var_name = file_name[len(f"{folder_name}_"):].rsplit(f"_{self.resolution}deg", 1)[0]
-                    remapped_files[var_name] = img_file
-                else:
-                    # Extract variable name
-                    var_name = file_name[len(f"{folder_name}_"):-4]  # Remove .png extension
-                    native_grid_files[var_name] = img_file
+        # Categorize files by experiment, grid type and variable
+        categorized = self._categorize_images(all_images, [folder_name])
+        native_grid_files = categorized[(folder_name, False)]
+        remapped_files = categorized[(folder_name, True)]
         
         # Add native grid plots
         if self.verbose:
@@ -279,22 +750,15 @@ class FluxPlotter:
             if self.verbose:
                 print(f"Adding native grid plot for {var_name}")
                 
-            html_content += f'''
+            parts.append(f'''
         <div class="plot-item">
             <h2>{var_name}</h2>
-            <img src="images/{img_file.name}" alt="{folder_name} {var_name}">
+            <img src="images/{img_file.name}" alt="{folder_name} {var_name}" loading="lazy" decoding="async">
         </div>
-'''
+''')
         
         # Add remapped content section
-        html_content += '''
-    </div>
-</div>
-
-<div id="RemappedPlots" class="tabcontent">
-    <h1>Remapped Plots</h1>
-    <div class="single-view">
-'''
+        parts.append(_HTML_MID_FMT.format(heading='Remapped Plots', view='single-view'))
         
         # Add remapped plots
         if self.verbose:
@@ -304,168 +768,31 @@ class FluxPlotter:
             if self.verbose:
                 print(f"Adding remapped plot for {var_name}")
                 
-            html_content += f'''
+            parts.append(f'''
         <div class="plot-item">
             <h2>{var_name} ({self.resolution}° grid)</h2>
-            <img src="images/{img_file.name}" alt="{folder_name} {var_name} {self.resolution} degree">
+            <img src="images/{img_file.name}" alt="{folder_name} {var_name} {self.resolution} degree" loading="lazy" decoding="async">
         </div>
-'''
+''')
         
         # Build the skipped files list
-        skipped_files_html = ""
-        for file in sorted(self.skipped_files):
-            skipped_files_html += f"<li>{file}</li>\n"
+        skipped_files_html = "".join(f"<li>{file}</li>\n" for file in sorted(self.skipped_files))
             
-        # Add stats and skipped files section with proper escaping for JavaScript
-        html_content += f'''
-    </div>
-</div>
-
-<div class="stats">
-    <p>Files plotted: {len(self.plotted_files)}, Files skipped: {len(self.skipped_files)}</p>
-    <span class="toggle" onclick="toggleSkippedList()">Show/hide skipped files</span>
-    <div id="skippedList" class="skipped-list">
-        <ul>
-            {skipped_files_html}
-        </ul>
-    </div>
-</div>
-
-<script>
-function openPlotType(evt, plotType) {{
-    var i, tabcontent, tablinks;
-    tabcontent = document.getElementsByClassName("tabcontent");
-    for (i = 0; i < tabcontent.length; i++) {{
-        tabcontent[i].style.display = "none";
-    }}
-    tablinks = document.getElementsByClassName("tablinks");
-    for (i = 0; i < tablinks.length; i++) {{
-        tablinks[i].className = tablinks[i].className.replace(" active", "");
-    }}
-    document.getElementById(plotType).style.display = "block";
-    evt.currentTarget.className += " active";
-}}
-
-function toggleSkippedList() {{
-    var list = document.getElementById("skippedList");
-    if (list.style.display === "block") {{
-        list.style.display = "none";
-    }} else {{
-        list.style.display = "block";
-    }}
-}}
-</script>
-</body>
-</html>'''
+        # Add stats and skipped files section
+        parts.append(_HTML_FOOTER_FMT.format(plotted=len(self.plotted_files),
+                                             skipped=len(self.skipped_files),
+                                             skipped_files_html=skipped_files_html))
 
         # Write the HTML file
         with open(self.output_dir / 'comparison.html', 'w') as f:
-            f.write(html_content)
+            f.write(''.join(parts))
             
     def generate_html_comparison(self, all_images, comparison_folders=None):
         """Generate an HTML comparison page for two folders."""
-        html_content = '''<!DOCTYPE html>
-<html>
-<head>
-<title>Flux Comparison</title>
-<style>
-    /* Styles for the comparison HTML */
-    body {
-        font-family: Arial, sans-serif;
-        background-color: #f5f5f5;
-        margin: 0;
-        padding: 20px;
-    }
-    h1 {
-        color: #333;
-        border-bottom: 1px solid #ccc;
-        padding-bottom: 10px;
-    }
-    h2 {
-        color: #444;
-        margin-top: 5px;
-    }
-    .comparison {
-        display: flex;
-        flex-direction: column;
-        gap: 20px;
-    }
-    .pair {
-        display: flex;
-        gap: 20px;
-        background: white;
-        padding: 15px;
-        border-radius: 5px;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-    }
-    .pair > div {
-        flex: 1;
-    }
-    img {
-        width: 100%;
-        height: auto;
-        border: 1px solid #ddd;
-    }
-    .stats {
-        background: white;
-        padding: 15px;
-        border-radius: 5px;
-        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        margin-top: 20px;
-    }
-    .toggle {
-        cursor: pointer;
-        color: #06c;
-        text-decoration: underline;
-    }
-    .skipped-list {
-        display: none;
-        margin-top: 10px;
-        padding: 10px;
-        background: #fff;
-        border: 1px solid #ddd;
-    }
-    /* Tab styles */
-    .tab {
-        overflow: hidden;
-        border: 1px solid #ccc;
-        background-color: #f1f1f1;
-        margin-bottom: 20px;
-    }
-    .tab button {
-        background-color: inherit;
-        float: left;
-        border: none;
-        outline: none;
-        cursor: pointer;
-        padding: 14px 16px;
-        transition: 0.3s;
-        font-size: 16px;
-    }
-    .tab button:hover {
-        background-color: #ddd;
-    }
-    .tab button.active {
-        background-color: #ccc;
-    }
-    .tabcontent {
-        display: none;
-        padding: 6px 12px;
-        border: 1px solid #ccc;
-        border-top: none;
-    }
-</style>
-</head>
-<body>
-<div class="tab">
-    <button class="tablinks active" onclick="openPlotType(event, 'NativeGridPlots')">Native Grid</button>
-    <button class="tablinks" onclick="openPlotType(event, 'RemappedPlots')">Remapped</button>
-</div>
-
-<div id="NativeGridPlots" class="tabcontent" style="display: block;">
-    <h1>Native Grid Flux Comparison</h1>
-    <div class="comparison">
-'''
+        self._write_html_assets('comparison.css', _HTML_COMPARISON_STYLE)
+        parts = [_HTML_HEAD_FMT.format(title="Flux Comparison",
+                                       page_style='comparison.css'),
+                 _HTML_TABS_FMT.format(heading='Native Grid Flux Comparison', view='comparison')]
         
         # If comparison folders are specified, use them directly
         if comparison_folders and len(comparison_folders) >= 2:
@@ -493,42 +820,16 @@ function toggleSkippedList() {{
         if self.verbose:
             print(f"Using experiment names for comparison: {exp1_name} and {exp2_name}")
         
-        # Create dictionaries to store files by prefix and variable
-        exp1_native_grid_files = {}
-        exp2_native_grid_files = {}
-        exp1_remapped_files = {}
-        exp2_remapped_files = {}
-        
         # Debug: List all files
         if self.verbose:
             print(f"Found {len(all_images)} images in directory: {self.image_dir}")
             
-        # Categorize files
-        for img_file in all_images:
-            file_name = img_file.name
-            if self.verbose:
-                print(f"Processing image file: {file_name}")
-            
-            # Determine if it's remapped or native grid
-            is_remapped = f"_{self.resolution}deg" in file_name
-            
-            # Extract experiment name and variable name
-            if file_name.startswith(f"{exp1_name}_"):
-                if is_remapped:
-                    # Extract variable name without resolution suffix
-                    var_name = file_name[len(f"{exp1_name}_"):].rsplit(f"_{self.resolution}deg", 1)[0]
-                    exp1_remapped_files[var_name] = img_file
-                else:
-                    # Extract variable name
-                    var_name = file_name[len(f"{exp1_name}_"):-4]  # Remove .png extension
-                    exp1_native_grid_files[var_name] = img_file
-            elif file_name.startswith(f"{exp2_name}_"):
-                if is_remapped:
-                    var_name = file_name[len(f"{exp2_name}_"):].rsplit(f"_{self.resolution}deg", 1)[0]
-                    exp2_remapped_files[var_name] = img_file
-                else:
-                    var_name = file_name[len(f"{exp2_name}_"):-4]  # Remove .png extension
-                    exp2_native_grid_files[var_name] = img_file
+        # Categorize files by experiment, grid type and variable
+        categorized = self._categorize_images(all_images, [exp1_name, exp2_name])
+        exp1_native_grid_files = categorized[(exp1_name, False)]
+        exp2_native_grid_files = categorized[(exp2_name, False)]
+        exp1_remapped_files = categorized[(exp1_name, True)]
+        exp2_remapped_files = categorized[(exp2_name, True)]
                     
         if self.verbose:
             print(f"Native grid {exp1_name} files: {list(exp1_native_grid_files.keys())}")
@@ -536,6 +837,10 @@ function toggleSkippedList() {{
             print(f"Remapped {exp1_name} files: {list(exp1_remapped_files.keys())}")
             print(f"Remapped {exp2_name} files: {list(exp2_remapped_files.keys())}")
             
+        # List the thumbnails once instead of checking for each image
+        with os.scandir(self.thumb_dir) as entries:
+            thumb_names = {entry.name for entry in entries}
+        
         # Find common variable names for native grid
         common_vars_native_grid = sorted(set(exp1_native_grid_files.keys()) & set(exp2_native_grid_files.keys()))
         
@@ -551,38 +856,14 @@ function toggleSkippedList() {{
             if self.verbose:
                 print(f"Adding native grid plot pair for {var_name}")
                 
-            html_content += f'''
-        <div class="pair">
-            <div>
-                <h2>{exp1_name} - {var_name}</h2>
-                <img src="images/{exp1_file.name}" alt="{exp1_name} {var_name}">
-            </div>
-            <div>
-                <h2>{exp2_name} - {var_name}</h2>
-                <img src="images/{exp2_file.name}" alt="{exp2_name} {var_name}">
-            </div>
-        </div>
-'''
+            parts.append(self._pair_html(var_name, exp1_name, exp1_file, exp2_name, exp2_file, thumb_names))
             native_grid_plots_added += 1
         
         # If no native grid plots were added, provide a message
         if native_grid_plots_added == 0:
-            html_content += '''
-        <div class="pair">
-            <div>
-                <h2>No native grid plots available</h2>
-            </div>
-        </div>
-'''
+            parts.append(_HTML_NO_PLOTS_FMT.format(kind='native grid'))
         
-        html_content += '''
-    </div>
-</div>
-
-<div id="RemappedPlots" class="tabcontent">
-    <h1>Remapped Flux Comparison</h1>
-    <div class="comparison">
-'''
+        parts.append(_HTML_MID_FMT.format(heading='Remapped Flux Comparison', view='comparison'))
         # Find common variable names for remapped files
         common_vars_remapped = sorted(set(exp1_remapped_files.keys()) & set(exp2_remapped_files.keys()))
         
@@ -593,85 +874,105 @@ function toggleSkippedList() {{
         higher_res_plots_added = 0
         for var_name in common_vars_remapped:
             exp1_file = exp1_remapped_files[var_name]
-            exp2_file = exp2_remapped_files[var_name]
-            
-            if self.verbose:
-                print(f"Adding remapped plot pair for {var_name}")
-                
-            html_content += f'''
-        <div class="pair">
-            <div>
-                <h2>{exp1_name} - {var_name} ({self.resolution}° grid)</h2>
-                <img src="images/{exp1_file.name}" alt="{exp1_name} {var_name}">
-            </div>
-            <div>
-                <h2>{exp2_name} - {var_name} ({self.resolution}° grid)</h2>
-                <img src="images/{exp2_file.name}" alt="{exp2_name} {var_name}">
-            </div>
-        </div>
-'''
+            exp2_file = exp2_remapped_files[var_name]
+            
+            if self.verbose:
+                print(f"Adding remapped plot pair for {var_name}")
+                
+            parts.append(self._pair_html(var_name, exp1_name, exp1_file, exp2_name, exp2_file, thumb_names,
+                                         f" ({self.resolution}° grid)"))
             higher_res_plots_added += 1
         
         # If no higher resolution plots were added, provide a message
         if higher_res_plots_added == 0:
-            html_content += '''
-        <div class="pair">
-            <div>
-                <h2>No remapped plots available</h2>
-            </div>
-        </div>
-'''
+            parts.append(_HTML_NO_PLOTS_FMT.format(kind='remapped'))
 
         # Build the skipped files list
-        skipped_files_html = ""
-        for file in sorted(self.skipped_files):
-            skipped_files_html += f"<li>{file}</li>\n"
+        skipped_files_html = "".join(f"<li>{file}</li>\n" for file in sorted(self.skipped_files))
         
-        # Add stats and skipped files section with proper escaping for JavaScript
-        html_content += f'''
-    </div>
-</div>
-
-<div class="stats">
-    <p>Files plotted: {len(self.plotted_files)}, Files skipped: {len(self.skipped_files)}</p>
-    <span class="toggle" onclick="toggleSkippedList()">Show/hide skipped files</span>
-    <div id="skippedList" class="skipped-list">
-        <ul>
-            {skipped_files_html}
-        </ul>
-    </div>
-</div>
-
-<script>
-function openPlotType(evt, plotType) {{
-    var i, tabcontent, tablinks;
-    tabcontent = document.getElementsByClassName("tabcontent");
-    for (i = 0; i < tabcontent.length; i++) {{
-        tabcontent[i].style.display = "none";
-    }}
-    tablinks = document.getElementsByClassName("tablinks");
-    for (i = 0; i < tablinks.length; i++) {{
-        tablinks[i].className = tablinks[i].className.replace(" active", "");
-    }}
-    document.getElementById(plotType).style.display = "block";
-    evt.currentTarget.className += " active";
-}}
-
-function toggleSkippedList() {{
-    var list = document.getElementById("skippedList");
-    if (list.style.display === "block") {{
-        list.style.display = "none";
-    }} else {{
-        list.style.display = "block";
-    }}
-}}
-</script>
-</body>
-</html>'''
+        # Add stats and skipped files section
+        parts.append(_HTML_FOOTER_FMT.format(plotted=len(self.plotted_files),
+                                             skipped=len(self.skipped_files),
+                                             skipped_files_html=skipped_files_html))
 
         # Write the HTML file
         with open(self.output_dir / 'comparison.html', 'w') as f:
-            f.write(html_content)
+            f.write(''.join(parts))
+    
+    def _write_html_assets(self, page_style_name, page_style):
+        """Write the style sheets and script the HTML pages link to.
+        
+        Files that are already up to date are not rewritten, so browsers can
+        keep serving them from their cache.
+        
+        Args:
+            page_style_name: File name of the page specific style sheet
+            page_style: Content of the page specific style sheet
+        """
+        for name, content in (('style.css', _HTML_BASE_STYLE),
+                              (page_style_name, page_style),
+                              ('tabs.js', _HTML_TABS_JS)):
+            path = self.output_dir / name
+            if not path.exists() or path.read_text() != content:
+                path.write_text(content)
+    
+    def _pair_html(self, var_name, exp1_name, exp1_file, exp2_name, exp2_file, thumb_names, title_suffix=''):
+        """Return the HTML block showing one variable of two experiments side by side."""
+        return f'''
+        <div class="pair">
+            <div>
+                <h2>{exp1_name} - {var_name}{title_suffix}</h2>
+                {self._thumbnail_html(exp1_file, f"{exp1_name} {var_name}", thumb_names)}
+            </div>
+            <div>
+                <h2>{exp2_name} - {var_name}{title_suffix}</h2>
+                {self._thumbnail_html(exp2_file, f"{exp2_name} {var_name}", thumb_names)}
+            </div>
+        </div>
+'''
+    
+    def _thumbnail_html(self, img_file, alt, thumb_names):
+        """Return a lazily loaded thumbnail linking to the full image.
+        
+        Images plotted before thumbnails existed are shown directly.
+        
+        Args:
+            img_file: Path of the full image
+            alt: Alternative text of the image
+            thumb_names: File names in the thumbnail directory
+        """
+        if img_file.name not in thumb_names:
+            return f'<img src="images/{img_file.name}" alt="{alt}" loading="lazy" decoding="async">'
+        return (f'<a href="images/{img_file.name}"><img src="images/thumbs/{img_file.name}" '
+                f'alt="{alt}" loading="lazy" decoding="async"></a>')
+    
+    def _categorize_images(self, all_images, experiment_names):
+        """Sort image files by experiment, grid type and variable name.
+        
+        Image names have the form ``{experiment}_{variable}.png`` for native
+        grid plots and ``{experiment}_{variable}_{resolution}deg.png`` for
+        remapped plots, or the same with ``.webp``. A single precompiled
+        pattern is matched per file.
+        
+        Args:
+            all_images: Paths of the image files
+            experiment_names: Names of the experiments to sort the images into
+        
+        Returns:
+            Dict mapping (experiment name, is_remapped) to {variable name: image file}
+        """
+        pattern = re.compile(
+            r'^(?P<exp>' + '|'.join(re.escape(name) for name in experiment_names) + r')_'
+            r'(?P<var>.+?)(?P<remapped>_' + re.escape(str(self.resolution)) + r'deg)?\.(?:png|webp)$'
+        )
+        categorized = {(name, is_remapped): {} for name in experiment_names for is_remapped in (False, True)}
+        for img_file in all_images:
+            if self.verbose:
+                print(f"Processing image file: {img_file.name}")
+            match = pattern.match(img_file.name)
+            if match:
+                categorized[(match['exp'], match['remapped'] is not None)][match['var']] = img_file
+        return categorized
             
     def reshape_1d_to_2d(self, data: np.ndarray, target_shape: tuple) -> np.ndarray:
         """Reshape 1D data to 2D based on target shape."""
@@ -710,57 +1011,117 @@ function toggleSkippedList() {{
         else:  # RnfA
             return grid_ds['RnfA.lon'].values, grid_ds['RnfA.lat'].values
     
+    def load_coordinates(self, folder: str, grid_ds: xr.Dataset) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Read the coordinates of every grid type in the grids dataset once.
+        
+        The arrays are flattened, cast to float32 and longitudes are converted
+        from [0, 360] to [-180, 180], so files can use them directly. Grid types missing from
+        the dataset are left out.
+        """
+        coords = {}
+        for coord_type in ('A', 'feom', 'RnfA'):
+            try:
+                lon, lat = self.get_coordinates(folder, grid_ds, coord_type)
+            except (KeyError, ValueError) as e:
+                if self.verbose:
+                    print(f"No '{coord_type}' grid in folder {folder}: {e}")
+                continue
+            # float32 is plenty for plotting and halves the memory traffic
+            lon = np.ravel(lon).astype(np.float32)
+            lat = np.ravel(lat).astype(np.float32)
+            lon[lon > 180] -= 360
+            coords[coord_type] = (lon, lat)
+        return coords
+    
     def print_memory_usage(self, label: str = ""):
         """Print the current memory usage."""
-        if self.verbose:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            print(f"Memory usage {label}: {memory_info.rss / 1024 / 1024:.2f} MB")
-        
-    @dask.delayed
-    def process_file(self, nc_file: Path, grid_ds: xr.Dataset):
-        """Process a single netCDF file and create its plot."""
-        # Skip grids file and mesh diagnostic file
-        if nc_file.name == 'grids.nc' or nc_file.name == 'fesom.mesh.diag.nc':
+        if not self.verbose:
             return
-
-        if self.verbose:
-            print(f"Processing {nc_file.name} (parallel)")
+        if self._psutil_proc is None:
+            self._psutil_proc = psutil.Process()
+        memory_info = self._psutil_proc.memory_info()
+        print(f"Memory usage {label}: {memory_info.rss / 1024 / 1024:.2f} MB")
+    
+    @staticmethod
+    def _open_data_file(nc_file: Path):
+        """Open a coupling field file for reading a single timestep.
+        
+        The file is opened with netCDF4 directly: indexing a variable reads
+        only that hyperslab from disk, and none of xarray's coordinate and
+        time decoding is done for the one variable read per file. Masking and
+        scaling are done by _decode_field like xarray does.
+        """
+        return netCDF4.Dataset(nc_file, 'r')
+    
+    @staticmethod
+    def get_coord_type(file_name: str) -> str:
+        """Determine the coordinate type of a file from its name.
+        
+        Args:
+            file_name: Name of the netCDF file
+            
+        Returns:
+            Coordinate type, 'A', 'feom' or 'RnfA'
+        """
         # Determine coordinate type based on filename prefix
-        if nc_file.name.startswith('A_'):
+        if file_name.startswith('A_'):
             coord_type = 'A'
-        elif nc_file.name.startswith('R_'):
+        elif file_name.startswith('R_'):
             coord_type = 'RnfA'
         else:
             coord_type = 'feom'
         
+        # Refine the coordinate type using filename patterns of the different grids
+        if '_ico_' in file_name or '_oce_' in file_name or 'fesom' in file_name:
+            coord_type = 'feom'  # Ocean grid
+        elif '_OpenIFS_' in file_name or '_ice_' in file_name:
+            coord_type = 'A'     # Atmosphere grid
+        elif 'RnfA' in file_name:
+            coord_type = 'RnfA'   # Runoff grid
+        return coord_type
+    
+    def read_field(self, nc_file: Path):
+        """Read the selected timestep of the first data variable of a file.
+        
+        Args:
+            nc_file: Path of the netCDF file
+            
+        Returns:
+            Tuple of (variable name, data array), ('', None) if the file has
+            no data variable or (None, None) if it cannot be read
+        """
         try:
             # Open the file
-            with xr.open_dataset(nc_file) as ds:
-                var_keys = [key for key in ds.variables if key != 'time' and key not in ds.dims]
+            with _NETCDF_LOCK, self._open_data_file(nc_file) as nc:
+                self.print_memory_usage(f"After opening {nc_file.name}")
+                var_keys = [key for key in nc.variables if key != 'time' and key not in nc.dimensions]
                 if not var_keys:
-                    self.skipped_files.append(nc_file.name)
-                    return
+                    return '', None
                 
                 var_name = var_keys[0]  # Use the first variable that isn't time or a dimension
+                var = nc.variables[var_name]
+                # Read the raw values, see _decode_field
+                var.set_auto_maskandscale(False)
                 
                 # Check data dimensions and extract timestep
                 if self.verbose:
-                    print(f"Variable {var_name} shape: {ds[var_name].shape}")
+                    print(f"Variable {var_name} shape: {var.shape}")
                 
                 # If the variable has multiple timesteps, extract only the one we want
-                if 'time' in ds[var_name].dims:
+                index = [slice(None)] * var.ndim
+                if 'time' in var.dimensions:
+                    time_axis = var.dimensions.index('time')
+                    n_times = var.shape[time_axis]
                     # Load only the specified timestep
-                    if self.timestep < ds[var_name].shape[0]:
+                    if self.timestep < n_times:
                         if self.verbose:
-                            print(f"Loading only timestep {self.timestep} out of {ds[var_name].shape[0]}")
-                        var_data = ds[var_name].isel(time=self.timestep).values
+                            print(f"Loading only timestep {self.timestep} out of {n_times}")
+                        index[time_axis] = self.timestep
                     else:
                         if self.verbose:
                             print(f"Timestep {self.timestep} out of range, using timestep 0")
-                        var_data = ds[var_name].isel(time=0).values
-                else:
-                    var_data = ds[var_name].values
+                        index[time_axis] = 0
+                var_data = self._decode_field(var, var[tuple(index)])
                     
                 # Check if there are more dimensions to reduce
                 if var_data.ndim > 2:
@@ -771,27 +1132,91 @@ function toggleSkippedList() {{
                         if self.verbose:
                             print(f"Taking first slice of dimension 0")
                         var_data = var_data[0, ...]
+                    
+                self.print_memory_usage(f"After reading {var_name} from {nc_file.name}")
         except Exception as e:
             if self.verbose:
                 print(f"Error processing {nc_file}: {e}")
-            self.skipped_files.append(nc_file.name)
-            return
+            return None, None
+        
+        return var_name, var_data
+    
+    @staticmethod
+    def _decode_field(var, raw):
+        """Turn raw netCDF values into float32 data the way xarray's CF decoding does.
+        
+        Values equal to _FillValue or missing_value become NaN, then
+        scale_factor and add_offset are applied. Unlike netCDF4's own auto
+        masking, values outside valid_min/valid_max/valid_range and the default
+        netCDF fill value of variables without _FillValue are kept as data.
+        
+        Args:
+            var: netCDF4 variable the values were read from
+            raw: Values read with auto masking and scaling disabled
+            
+        Returns:
+            New float32 array
+        """
+        attrs = var.ncattrs()
+        data = np.asarray(raw).astype(np.float32)
+        for attr in ('_FillValue', 'missing_value'):
+            if attr in attrs:
+                for fill_value in np.ravel(var.getncattr(attr)):
+                    # NaN fill values are NaN in data already
+                    if not (isinstance(fill_value, (float, np.floating)) and np.isnan(fill_value)):
+                        data[raw == fill_value] = np.nan
+        if 'scale_factor' in attrs:
+            data *= np.float32(var.getncattr('scale_factor'))
+        if 'add_offset' in attrs:
+            data += np.float32(var.getncattr('add_offset'))
+        return data
+    
+    def _process_file_impl(self, nc_file: Path, coord_type: str = None, field=None):
+        """Process a single netCDF file and create its plots.
+        
+        Used directly in sequential mode and through _process_file_worker in
+        worker processes, so the outcome is returned instead of being recorded
+        on self.
+        
+        Args:
+            nc_file: Path of the netCDF file
+            coord_type: Coordinate type of the file, derived from its name if None
+            field: Result of read_field for the file if it was already read,
+                e.g. prefetched while the previous file was plotted
             
-        # Determine the appropriate coordinate type based on the file name
-        # This handles different grid types by looking at filename patterns
-        file_coord_type = coord_type
-        if '_ico_' in nc_file.name or '_oce_' in nc_file.name or 'fesom' in nc_file.name:
-            file_coord_type = 'feom'  # Ocean grid
-        elif '_OpenIFS_' in nc_file.name or '_ice_' in nc_file.name:
-            file_coord_type = 'A'     # Atmosphere grid
-        elif 'RnfA' in nc_file.name:
-            file_coord_type = 'RnfA'   # Runoff grid
+        Returns:
+            Tuple of ('plotted', 'skipped' or 'empty', file name, written image
+            paths), or None for the grid and mesh files. 'empty' files have no
+            data variable and are skipped as well.
+        """
+        # Skip grids file and mesh diagnostic file
+        if nc_file.name == 'grids.nc' or nc_file.name == 'fesom.mesh.diag.nc':
+            return None
+
+        if self.verbose:
+            print(f"Processing {nc_file.name}")
+        self.print_memory_usage(f"Before processing {nc_file.name}")
+        
+        if coord_type is None:
+            coord_type = self.get_coord_type(nc_file.name)
+        
+        if field is None:
+            field = self.read_field(nc_file)
+        var_name, var_data = field
+        if var_name == '':
+            return ('empty', nc_file.name, [])
+        if var_name is None:
+            return ('skipped', nc_file.name, [])
         
         if self.verbose:
-            print(f"Using coordinate type '{file_coord_type}' for file {nc_file.name}")
+            print(f"Using coordinate type '{coord_type}' for file {nc_file.name}")
             
         # Get coordinates for the specific grid type of this file
-        lon, lat = self.get_coordinates(nc_file.parent.name, grid_ds, file_coord_type)
+        if coord_type not in self._coord_cache:
+            if self.verbose:
+                print(f"No '{coord_type}' grid available - skipping {nc_file.name}")
+            return ('skipped', nc_file.name, [])
+        lon, lat = self._coord_cache[coord_type]
         
         # Check that coordinates and data array sizes match
         if lon.size != var_data.size and lat.size != var_data.size:
@@ -802,154 +1227,208 @@ function toggleSkippedList() {{
             if var_data.ndim == 1:
                 if self.verbose:
                     print(f"Incompatible grid sizes - skipping {nc_file.name}")
-                self.skipped_files.append(nc_file.name)
-                return
-        
-        # Replace NaNs with zeros
-        var_data = np.nan_to_num(var_data, nan=0.0)
-        
-        # Generate standard resolution plot
-        self._create_plot(nc_file, var_name, lon, lat, var_data, False)
+                return ('skipped', nc_file.name, [])
         
-        # Generate higher resolution plot if requested
-        if self.remap_higher_res:
-            remapped_data = self.remap_to_higher_res(lon, lat, var_data)
-            self._create_plot(nc_file, var_name, self.target_lon_mesh, self.target_lat_mesh, remapped_data, True)
-        
-        self.plotted_files.append(nc_file.name)
-        return nc_file.name  # Return the filename for tracking
-    
-    def process_file_sequential(self, nc_file: Path, grid_ds: xr.Dataset):
-        """Process a single netCDF file sequentially (non-dask version)."""
-        # Skip grids file and mesh diagnostic file
-        if nc_file.name == 'grids.nc' or nc_file.name == 'fesom.mesh.diag.nc':
-            return
-
-        self.print_memory_usage(f"Before processing {nc_file.name}")
-
-        # Determine coordinate type based on filename prefix
-        if nc_file.name.startswith('A_'):
-            coord_type = 'A'
-        elif nc_file.name.startswith('R_'):
-            coord_type = 'RnfA'
+        # Replace NaNs with zeros and convert to float32 like the coordinates, in one
+        # pass that also finds the colour range; float32 data as read from the
+        # file is owned here and cleaned in place
+        if var_data.dtype == np.float32 and var_data.flags.c_contiguous and var_data.flags.writeable:
+            cleaned = var_data
         else:
-            coord_type = 'feom'
+            cleaned = np.empty(var_data.shape, dtype=np.float32)
+        n_invalid, v_min, v_max = _scrub_f32(np.ravel(var_data), cleaned.reshape(-1))
         
-        try:
-            # Open the file
-            self.print_memory_usage(f"Before opening {nc_file.name}")
-            with xr.open_dataset(nc_file) as ds:
-                self.print_memory_usage(f"After opening {nc_file.name}")
-                var_keys = [key for key in ds.variables if key != 'time' and key not in ds.dims]
-                if not var_keys:
-                    self.skipped_files.append(nc_file.name)
-                    return
-                
-                var_name = var_keys[0]  # Use the first variable that isn't time or a dimension
-                
-                # Check data dimensions and extract timestep
-                if self.verbose:
-                    print(f"Variable {var_name} shape: {ds[var_name].shape}")
-                
-                # If the variable has multiple timesteps, extract only the one we want
-                if 'time' in ds[var_name].dims:
-                    # Load only the specified timestep
-                    if self.timestep < ds[var_name].shape[0]:
-                        if self.verbose:
-                            print(f"Loading only timestep {self.timestep} out of {ds[var_name].shape[0]}")
-                        var_data = ds[var_name].isel(time=self.timestep).values
-                    else:
-                        if self.verbose:
-                            print(f"Timestep {self.timestep} out of range, using timestep 0")
-                        var_data = ds[var_name].isel(time=0).values
-                else:
-                    var_data = ds[var_name].values
-                    
-                # Check if there are more dimensions to reduce
-                if var_data.ndim > 2:
-                    if self.verbose:
-                        print(f"Variable has {var_data.ndim} dimensions, shape {var_data.shape}")
-                    # If 3D, but first dimension is not time (already handled above)
-                    if var_data.shape[0] in [1, 2]:
-                        if self.verbose:
-                            print(f"Taking first slice of dimension 0")
-                        var_data = var_data[0, ...]
-                    # If there are more dimensions, we might need to handle them differently
-                    
-                self.print_memory_usage(f"After reading {var_name} from {nc_file.name}")
-        except Exception as e:
+        # An all-NaN field would only give an empty plot, so skip it before any plotting work
+        if n_invalid == cleaned.size:
             if self.verbose:
-                print(f"Error processing {nc_file}: {e}")
-            self.skipped_files.append(nc_file.name)
-            return
-        
-        self.print_memory_usage(f"Before getting coordinates for {nc_file.name}")
-        # Get coordinates
-        lon, lat = self.get_coordinates(nc_file.parent.name, grid_ds, coord_type)
-        self.print_memory_usage(f"After getting coordinates for {nc_file.name}")
-        
-        # Replace NaNs with zeros
-        var_data = np.nan_to_num(var_data, nan=0.0)
+                print(f"Skipping {nc_file.name}: no valid data")
+            return ('skipped', nc_file.name, [])
+        var_data = cleaned
+        # The replaced values are plotted as zeros
+        if n_invalid:
+            v_min, v_max = min(v_min, 0.0), max(v_max, 0.0)
         
         # Generate standard resolution plot
-        self.print_memory_usage(f"Before creating standard plot for {nc_file.name}")
-        self._create_plot(nc_file, var_name, lon, lat, var_data, False)
+        images = [self._create_plot(nc_file, var_name, lon, lat, var_data, False,
+                                    data_range=(0, v_min, v_max))]
         self.print_memory_usage(f"After creating standard plot for {nc_file.name}")
         
         # Generate higher resolution plot if requested
         if self.remap_higher_res:
-            self.print_memory_usage(f"Before remapping {nc_file.name}")
-            remapped_data = self.remap_to_higher_res(lon, lat, var_data)
+            # Reuse the remapped field of an earlier run if the file has not changed
+            cache_path = self._remap_cache_path(nc_file, coord_type)
+            remapped_data = self._load_remapped(cache_path, nc_file)
+            if remapped_data is None:
+                # var_data has no NaNs left, so the cached weights of the full grid apply
+                remapped_data = self.remap_to_higher_res(lon, lat, var_data, self._grid_keys[coord_type],
+                                                         check_nan=False)
+                self._save_remapped(cache_path, remapped_data)
             self.print_memory_usage(f"After remapping {nc_file.name}")
-            self._create_plot(nc_file, var_name, self.target_lon_mesh, self.target_lat_mesh, remapped_data, True)
+            images.append(self._create_plot(nc_file, var_name, self.target_lon, self.target_lat, remapped_data, True))
             self.print_memory_usage(f"After creating remapped plot for {nc_file.name}")
         
-        self.plotted_files.append(nc_file.name)
-        
-        # Explicitly delete variables to free memory
-        del var_data
-        if self.remap_higher_res and 'remapped_data' in locals():
-            del remapped_data
-        gc.collect()
-        self.print_memory_usage(f"After cleanup for {nc_file.name}")
+        return ('plotted', nc_file.name, images)
     
     def process_folder(self, folder: str, max_files: int = 0):
         """Process all files in a folder with parallel or sequential processing."""
         folder_path = self.base_dir / 'data' / folder
         
-        # Load grids once for the folder
-        chunks = {'x_A096': 4032, 'x_feom': 12685}
-        with xr.open_dataset(folder_path / 'grids.nc', chunks=chunks) as grid_ds:
-            # Get all .nc files
-            nc_files = list(folder_path.glob('*.nc'))
-            if max_files > 0:
-                nc_files = nc_files[:max_files]
-                
-            if self.parallel:
-                # Parallel processing with dask
-                if self.verbose:
-                    print(f"Processing folder {folder} in parallel mode")
-                # Create list of delayed tasks
-                tasks = [self.process_file(nc_file, grid_ds) for nc_file in nc_files]
-                
-                # Execute tasks in parallel with progress bar
-                with ProgressBar():
-                    processed_files = dask.compute(*tasks)
-                    if self.verbose:
-                        print(f"Processed {len([f for f in processed_files if f is not None])} files")
+        # Load the grid coordinates once for the folder; the few coordinate
+        # variables are read straight into NumPy, without a dask graph
+        with xr.open_dataset(folder_path / 'grids.nc', cache=False) as grid_ds:
+            self._coord_cache = self.load_coordinates(folder, grid_ds)
+        self._grid_keys = {coord_type: self.grid_digest(lon, lat)
+                           for coord_type, (lon, lat) in self._coord_cache.items()}
+        
+        # Get all .nc files
+        nc_files = list(folder_path.glob('*.nc'))
+        if max_files > 0:
+            nc_files = nc_files[:max_files]
+        
+        # Group the files by source grid, so each grid's remapping weights are
+        # built once and then reused by all files of the group
+        # Files already known to have no data variable are skipped without opening them
+        groups = {}
+        file_keys = {}
+        for nc_file in nc_files:
+            if nc_file.name == 'grids.nc' or nc_file.name == 'fesom.mesh.diag.nc':
+                continue
+            file_keys[nc_file.name] = key = self._file_key(nc_file)
+            if key in self._skip_cache:
+                self.skipped_files.append(nc_file.name)
+                continue
+            groups.setdefault(self.get_coord_type(nc_file.name), []).append(nc_file)
+        
+        # Compute the remapping weights of the grids in use up front, otherwise
+        # every worker process would triangulate the source grids again
+        if self.remap_higher_res:
+            for coord_type in groups:
+                if coord_type in self._coord_cache:
+                    lon, lat = self._coord_cache[coord_type]
+                    n_points = min(len(lon), len(lat))
+                    self._get_interp_weights((self._grid_keys[coord_type], n_points), lon[:n_points], lat[:n_points])
+            
+        if self.parallel:
+            # Parallel processing in worker processes; plotting is GIL-bound,
+            # so threads would hardly run in parallel
+            if self.verbose:
+                print(f"Processing folder {folder} in parallel mode")
+            tasks = [(nc_file, coord_type) for coord_type, group in groups.items() for nc_file in group]
+            processed_files = []
+            if tasks:
+                # Each worker receives the plotter, with its coordinates and
+                # weights, once and keeps reusing it and its figure
+                max_workers = min(os.cpu_count() or 1, len(tasks))
+                with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                         initargs=(self,)) as executor:
+                    # Hand out the files in small batches to cut the inter-process
+                    # round trips, while keeping enough batches to balance the load
+                    chunksize = max(1, len(tasks) // (4 * max_workers))
+                    results = executor.map(_process_file_worker, *zip(*tasks), chunksize=chunksize)
+                    processed_files = list(tqdm(results, total=len(tasks), desc=folder))
+        else:
+            # Sequential processing
+            if self.verbose:
+                print(f"Processing folder {folder} in sequential mode")
+            tasks = [(nc_file, coord_type) for coord_type, group in groups.items() for nc_file in group]
+            processed_files = []
+            # Read the next file in a background thread while the current one
+            # is plotted, overlapping disk I/O with the plotting work
+            with ThreadPoolExecutor(max_workers=1) as reader:
+                next_field = reader.submit(self.read_field, tasks[0][0]) if tasks else None
+                for i, (nc_file, coord_type) in enumerate(tasks):
+                    field = next_field.result()
+                    if i + 1 < len(tasks):
+                        next_field = reader.submit(self.read_field, tasks[i + 1][0])
+                    processed_files.append(self._process_file_impl(nc_file, coord_type, field))
+                    # Arrays are freed by reference counting as soon as a file is
+                    # done; a full collection for reference cycles of the plotting
+                    # objects is only worth it every few files
+                    if (i + 1) % _GC_INTERVAL == 0:
+                        gc.collect()
+                        self.print_memory_usage(f"After cleanup for {nc_file.name}")
+        
+        # Collect the outcome of the files
+        n_skip_cache = len(self._skip_cache)
+        for result in processed_files:
+            if result is None:
+                continue
+            status, file_name, images = result
+            if status == 'plotted':
+                self.plotted_files.append(file_name)
+                self.image_files.extend(images)
             else:
-                # Sequential processing
-                if self.verbose:
-                    print(f"Processing folder {folder} in sequential mode")
-                for nc_file in nc_files:
-                    if self.verbose:
-                        print(f"Processing {nc_file.name}")
-                    # Process file directly without dask.delayed
-                    self.process_file_sequential(nc_file, grid_ds)
-                    # Force garbage collection after each file
-                    gc.collect()
+                self.skipped_files.append(file_name)
+                if status == 'empty':
+                    self._skip_cache.add(file_keys[file_name])
+        if len(self._skip_cache) != n_skip_cache:
+            self._save_skip_cache()
+        if self.verbose:
+            print(f"Processed {len([r for r in processed_files if r is not None])} files")
 
-    def _create_plot(self, nc_file, var_name, lon, lat, var_data, is_remapped):
+    def _remap_cache_path(self, nc_file: Path, coord_type: str) -> Path:
+        """Return the cache file of the remapped field of a file.
+        
+        The name covers everything the remapped field depends on: the file,
+        timestep, source grid, interpolation method and target resolution.
+        """
+        grid_key = self._grid_keys[coord_type][:12]
+        return self.remap_cache_dir / (f"{nc_file.parent.name}_{nc_file.stem}_t{self.timestep}_"
+                                       f"{grid_key}_{self.interp}_{self.resolution}deg.nc")
+    
+    def _load_remapped(self, cache_path: Path, nc_file: Path):
+        """Read a cached remapped field if it is newer than its source file.
+        
+        Returns:
+            The remapped data array, or None if there is no usable cache file
+        """
+        try:
+            if cache_path.stat().st_mtime_ns <= nc_file.stat().st_mtime_ns:
+                return None
+            with _NETCDF_LOCK, xr.open_dataset(cache_path, cache=False) as ds:
+                data = ds['remapped'].values
+        except (OSError, KeyError, ValueError):
+            return None
+        if data.shape != (len(self.target_lat), len(self.target_lon)):
+            return None
+        if self.verbose:
+            print(f"Using cached remapped field {cache_path.name}")
+        return data.astype(np.float32, copy=False)
+    
+    def _save_remapped(self, cache_path: Path, data: np.ndarray):
+        """Write a remapped field to the cache, replacing any older version at once."""
+        ds = xr.Dataset({'remapped': (('lat', 'lon'), data)},
+                        coords={'lat': self.target_lat, 'lon': self.target_lon})
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with _NETCDF_LOCK:
+                ds.to_netcdf(tmp_path, encoding={'remapped': {'zlib': True, 'complevel': 1}})
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError) as e:
+            if self.verbose:
+                print(f"Could not cache remapped field {cache_path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _file_key(nc_file: Path):
+        """Return the (path, modification time, size) key of a file in the skip cache."""
+        stat = nc_file.stat()
+        return (str(nc_file.resolve()), stat.st_mtime_ns, stat.st_size)
+    
+    def _load_skip_cache(self):
+        """Read the keys of the files without a data variable found in earlier runs."""
+        try:
+            with open(self._skip_cache_path) as f:
+                return {tuple(key) for key in json.load(f)}
+        except (OSError, ValueError, TypeError):
+            return set()
+    
+    def _save_skip_cache(self):
+        """Write the skip cache, so later runs do not open these files again."""
+        with open(self._skip_cache_path, 'w') as f:
+            json.dump(sorted(self._skip_cache), f)
+    
+    def _create_plot(self, nc_file, var_name, lon, lat, var_data, is_remapped, data_range=None):
         """
         Create a plot for the given variable data.
         
@@ -967,18 +1446,20 @@ function toggleSkippedList() {{
             Variable data to plot
         is_remapped : bool
             Whether this is remapped data (True) or native grid data (False)
+        data_range : tuple, optional
+            (number of invalid values, min, max) of var_data if already known,
+            e.g. from cleaning the data
         """
         self.print_memory_usage(f"Start of _create_plot for {nc_file.name}")
         
-        # Determine whether to use reduced or full coastline detail based on file size
-        # For smaller files, we can afford more detail
-        resolution = '110m' if is_remapped else '110m'
-        
         # Make sure the plotting directory exists
         self.image_dir.mkdir(parents=True, exist_ok=True)
         
-        # Prepare data for plotting
-        plot_lon, plot_lat, var_data = lon, lat, var_data
+        # Prepare data for plotting; float32 is enough for the colour mapping
+        # (no copies when the caller already passes float32, as process_file does)
+        plot_lon = np.ascontiguousarray(lon, dtype=np.float32)
+        plot_lat = np.ascontiguousarray(lat, dtype=np.float32)
+        var_data = np.ascontiguousarray(var_data, dtype=np.float32)
         
         # For remapped data, ensure dimensions are correct
         if is_remapped and var_data.ndim == 2:
@@ -989,7 +1470,7 @@ function toggleSkippedList() {{
             if var_data.ndim > 1:
                 if self.verbose:
                     print(f"Flattening data from shape {var_data.shape}")
-                var_data = var_data.flatten()
+                var_data = var_data.ravel()
                 if self.verbose:
                     print(f"New data shape: {var_data.shape}")
             
@@ -999,26 +1480,12 @@ function toggleSkippedList() {{
         # Create output filename
         folder_name = nc_file.parent.name
         if is_remapped:
-            output_filename = self.image_dir / f"{folder_name}_{var_name}_{self.resolution}deg.png"
+            output_filename = self.image_dir / f"{folder_name}_{var_name}_{self.resolution}deg.{self.image_format}"
         else:
-            output_filename = self.image_dir / f"{folder_name}_{var_name}.png"
-        
-        # Create a new figure and axis for each plot
-        fig = plt.figure(figsize=(10, 6), dpi=300)
-        
-        # Use PlateCarree projection for both cases to avoid coordinate transformation issues
-        ax = fig.add_subplot(1, 1, 1, projection=ccrs.PlateCarree())
-        
-        # Reduce the amount of coastline detail
-        ax.coastlines(resolution=resolution, linewidth=0.5)
+            output_filename = self.image_dir / f"{folder_name}_{var_name}.{self.image_format}"
         
-        # Simplify gridlines
-        gl = ax.gridlines(draw_labels=True, linewidth=0.2, color='gray', alpha=0.5, linestyle=':')
-        gl.top_labels = False
-        gl.right_labels = False
-        
-        # Set global extent
-        ax.set_global()
+        # Reuse this plotter's figure; coastlines, gridlines and extent are already set up
+        fig, ax = self._get_figure()
         
         # Plot data based on structure
         if is_remapped:
@@ -1030,12 +1497,9 @@ function toggleSkippedList() {{
                 if plot_lat.ndim > 1:
                     plot_lat = plot_lat[:, 0]  # Extract first column for latitude
                 
-                # Create a 2D meshgrid for pcolormesh if needed
-                # This avoids cartopy geometry transformation issues
+                # With 1D coordinate vectors the grid is drawn as an image, so
+                # no 2D meshgrid is needed
                 if plot_lon.ndim == 1 and plot_lat.ndim == 1:
-                    # Create the 2D meshgrid required for pcolormesh
-                    mesh_lon, mesh_lat = np.meshgrid(plot_lon, plot_lat)
-                    
                     # Use imshow instead of pcolormesh to avoid geometry transformation issues
                     # This displays the data in the image coordinates directly
                     extent = [
@@ -1046,8 +1510,9 @@ function toggleSkippedList() {{
                         var_data, 
                         origin='lower', 
                         extent=extent,
-                        transform=ccrs.PlateCarree(),
+                        transform=_PC,
                         aspect='auto',
+                        interpolation='nearest',
                         cmap='viridis'
                     )
                 else:
@@ -1056,7 +1521,7 @@ function toggleSkippedList() {{
                         plot_lon, 
                         plot_lat, 
                         var_data, 
-                        transform=ccrs.PlateCarree(), 
+                        transform=_PC, 
                         cmap='viridis'
                     )
             except Exception as e:
@@ -1069,7 +1534,7 @@ function toggleSkippedList() {{
                     var_data, 
                     origin='lower', 
                     extent=extent,
-                    transform=ccrs.PlateCarree(),
+                    transform=_PC,
                     aspect='auto',
                     cmap='viridis'
                 )
@@ -1100,7 +1565,7 @@ function toggleSkippedList() {{
                             var_data.reshape(-1, 1) if var_data.ndim == 1 else var_data, 
                             origin='lower', 
                             extent=extent,
-                            transform=ccrs.PlateCarree(),
+                            transform=_PC,
                             aspect='auto',
                             cmap='viridis'
                         )
@@ -1114,44 +1579,23 @@ function toggleSkippedList() {{
                         var_data = var_data[:min_length]
                         
                         # Check for NaN or invalid values in var_data
-                        valid_mask = np.isfinite(var_data)
-                        if not np.all(valid_mask):
-                            invalid_count = np.sum(~valid_mask)
-                            if self.verbose:
-                                print(f"Found {invalid_count} invalid values in data. Replacing with zeros.")
-                            var_data = np.where(valid_mask, var_data, 0.0)
+                        data_range = self._clean_range(var_data)
+                        if data_range[0]:
+                            var_data = np.where(np.isfinite(var_data), var_data, np.float32(0.0))
                         
-                        cs = ax.scatter(
-                            plot_lon, 
-                            plot_lat, 
-                            c=var_data, 
-                            transform=ccrs.PlateCarree(),
-                            cmap='viridis', 
-                            s=1.0,  # Small point size to avoid overlapping
-                            alpha=0.7
-                        )
+                        cs = self._plot_points(ax, plot_lon, plot_lat, var_data, clim=data_range[1:])
                 else:
                     # Arrays are already compatible
-                    # Check for NaN or invalid values in var_data
-                    valid_mask = np.isfinite(var_data)
-                    if not np.all(valid_mask):
-                        invalid_count = np.sum(~valid_mask)
-                        if self.verbose:
-                            print(f"Found {invalid_count} invalid values in data. Replacing with zeros.")
-                        var_data = np.where(valid_mask, var_data, 0.0)
+                    # Check for NaN or invalid values in var_data, unless the caller did
+                    if data_range is None:
+                        data_range = self._clean_range(var_data)
+                    if data_range[0]:
+                        var_data = np.where(np.isfinite(var_data), var_data, np.float32(0.0))
                     
-                    cs = ax.scatter(
-                        plot_lon, 
-                        plot_lat, 
-                        c=var_data, 
-                        transform=ccrs.PlateCarree(),
-                        cmap='viridis', 
-                        s=1.0,  # Small point size to avoid overlapping
-                        alpha=0.7
-                    )
+                    cs = self._plot_points(ax, plot_lon, plot_lat, var_data, clim=data_range[1:])
                     
                 if self.verbose:
-                    print("Using scatter plot for original point cloud data")
+                    print("Using rasterized point plot for original point cloud data")
                     
             except Exception as e:
                 if self.verbose:
@@ -1170,50 +1614,217 @@ function toggleSkippedList() {{
                     var_data_display, 
                     origin='lower', 
                     extent=extent,
-                    transform=ccrs.PlateCarree(),
+                    transform=_PC,
                     aspect='auto',
                     cmap='viridis'
                 )
         
-        # Calculate min/max values for colorbar outside of NaN values
-        valid_data = var_data[~np.isnan(var_data)]
-        if len(valid_data) > 0:
-            v_min, v_max = np.min(valid_data), np.max(valid_data)
+        # Calculate min/max values for colorbar from the finite values, in a
+        # single pass unless the caller or the plotting branch already did it
+        if data_range is None:
+            data_range = _finite_range(var_data.reshape(-1))
+        _, v_min, v_max = data_range
+        cbar = self._cbar
+        if np.isfinite(v_min):
             if self.verbose:
                 print(f"Data range: min={v_min}, max={v_max}")
             
-            # Add colorbar - using the specific figure rather than the global plt state
-            fig.colorbar(cs, ax=ax, orientation='horizontal', pad=0.05, label=var_name)
+            # Fix the colour limits, so matplotlib does not scan the data again
+            # to autoscale the image when it is drawn
+            cs.set_clim(v_min, v_max)
+            
+            # Point the colorbar of the figure at the new data
+            cbar.update_normal(cs)
+            cbar.set_label(var_name)
+            cbar.ax.set_visible(True)
+        else:
+            cbar.ax.set_visible(False)
         
         # Add title
         ax.set_title(f"{folder_name}: {var_name}{' (remapped)' if is_remapped else ''}")
         
-        # Save the figure with consistent DPI and close it explicitly
-        fig.savefig(output_filename, dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        # Render once into the Agg buffer; the figure is set up at self.dpi
+        canvas = fig.canvas
+        canvas.draw()
+        
+        # The layout of the reused figure stays the same between plots, so the
+        # tight crop box (in pixels) is measured once
+        crop = self._bbox
+        if crop is None:
+            crop = self._tight_crop_box(fig, canvas.get_renderer())
+            if cbar.ax.get_visible():
+                self._bbox = crop
+        
+        # Encode the cropped buffer directly with fast zlib compression instead
+        # of letting savefig lay out and render the figure again
+        img = Image.fromarray(np.asarray(canvas.buffer_rgba())).crop(crop).convert('RGB')
+        _write_image(img, output_filename, self.image_format)
+        self._save_thumbnail(img, output_filename.name)
+        
+        # Drop the data so the figure can be reused
+        cs.remove()
         
         self.print_memory_usage(f"End of _create_plot for {nc_file.name}")
         
         return output_filename
     
+    @staticmethod
+    def _tight_crop_box(fig, renderer, pad_inches=0.1):
+        """Return the (left, upper, right, lower) pixel box of the drawn figure content.
+        
+        This is the area savefig(bbox_inches='tight') would keep, clipped to
+        the canvas.
+        """
+        bbox = fig.get_tightbbox(renderer).padded(pad_inches)
+        width, height = fig.canvas.get_width_height()
+        dpi = fig.dpi
+        left = max(0, int(np.floor(bbox.x0 * dpi)))
+        right = min(width, int(np.ceil(bbox.x1 * dpi)))
+        # Pixel rows count from the top, figure coordinates from the bottom
+        upper = max(0, height - int(np.ceil(bbox.y1 * dpi)))
+        lower = min(height, height - int(np.floor(bbox.y0 * dpi)))
+        return left, upper, right, lower
+    
+    def _save_thumbnail(self, img, file_name: str, width: int = 512):
+        """Save a downscaled copy of a plot for the comparison page.
+        
+        Args:
+            img: PIL image of the full resolution plot
+            file_name: File name of the plot
+            width: Width of the thumbnail in pixels
+        """
+        height = max(1, round(img.height * width / img.width))
+        _write_image(img.resize((width, height), Image.LANCZOS), self.thumb_dir / file_name, self.image_format)
+    
+    def _clean_range(self, values):
+        """Return (number of invalid values, min, max) of point data that is replaced by zeros.
+        
+        The invalid values are plotted as zeros, so the range includes zero
+        if there are any.
+        """
+        n_invalid, v_min, v_max = _finite_range(values)
+        if n_invalid:
+            if self.verbose:
+                print(f"Found {n_invalid} invalid values in data. Replacing with zeros.")
+            v_min, v_max = min(v_min, 0.0), max(v_max, 0.0)
+        return n_invalid, v_min, v_max
+    
+    def _plot_points(self, ax, lon, lat, values, bin_px=None, clim=None):
+        """Draw an unstructured point cloud as an image of binned means.
+        
+        A scatter plot builds and colour maps one marker per grid point, which
+        dominates the plotting time for large grids. Instead, the points are
+        averaged into bins of about the marker size of the former scatter plot
+        (1 pt, i.e. bin_px pixels) and the bins are drawn with imshow. Bins
+        without points stay transparent; each drawn bin is an average rather
+        than overlapping markers, so it is drawn opaque.
+        
+        Args:
+            ax: Map axes with global PlateCarree extent
+            lon: Longitudes in the range [-180, 180]
+            lat: Latitudes
+            values: Data values of the points, without NaNs
+            bin_px: Bin size in pixels, by default the size of 1 pt at self.dpi
+            clim: (min, max) of values if already known
+            
+        Returns:
+            The AxesImage
+        """
+        if bin_px is None:
+            bin_px = max(1, round(self.dpi / 72))
+        # The axes box is final from the start, see _get_figure
+        bbox = ax.get_window_extent()
+        nx = max(1, int(bbox.width / bin_px))
+        ny = max(1, int(bbox.height / bin_px))
+        
+        # Sum and count the points per bin in a single parallel pass
+        image = np.empty((ny, nx), dtype=np.float32)
+        n_chunks = min(get_num_threads(), _MAX_BIN_THREADS)
+        _bin_points(lon, lat, values, nx, ny, n_chunks, image.reshape(-1))
+        
+        cs = ax.imshow(
+            np.ma.masked_invalid(image),
+            origin='lower',
+            extent=[-180, 180, -90, 90],
+            transform=_PC,
+            aspect='auto',
+            interpolation='nearest',
+            cmap='viridis'
+        )
+        # Keep the colour scale of the individual points rather than the bin means
+        if clim is None and len(values) > 0:
+            clim = (np.min(values), np.max(values))
+        if clim is not None:
+            cs.set_clim(*clim)
+        return cs
+    
+    def _get_figure(self):
+        """Return the reusable figure and map axes of this plotter.
+        
+        Setting up the GeoAxes with coastlines and gridlines is the most
+        expensive part of a plot, so it is done once and only the data artist
+        and the colorbar change between plots. The figure is not pickled, so
+        each worker process builds its own.
+        """
+        if self._fig is None:
+            fig = Figure(figsize=(10, 6), dpi=self.dpi)
+            FigureCanvasAgg(fig)
+            
+            # Use PlateCarree projection for both cases to avoid coordinate transformation issues
+            ax = fig.add_subplot(1, 1, 1, projection=_PC)
+            
+            # Reduce the amount of coastline detail
+            ax.coastlines(resolution='110m', linewidth=0.5)
+            
+            # Simplify gridlines
+            gl = ax.gridlines(draw_labels=True, linewidth=0.2, color='gray', alpha=0.5, linestyle=':')
+            gl.top_labels = False
+            gl.right_labels = False
+            
+            # Set global extent
+            ax.set_global()
+            
+            # Make room for the colorbar and fix the map aspect now, so the axes
+            # box, and with it the bin grid of _plot_points, is final before the
+            # first plot; the colorbar is pointed at the data of each plot
+            cbar = fig.colorbar(ScalarMappable(cmap='viridis'), ax=ax, orientation='horizontal', pad=0.05)
+            cbar.ax.set_visible(False)
+            ax.apply_aspect()
+            
+            self._fig, self._ax, self._cbar, self._bbox = fig, ax, cbar, None
+        return self._fig, self._ax
+    
     def _extract_experiment_names_from_images(self, all_images):
-        """Extract experiment names from image filenames."""
-        experiment_names = set()
-        for img_file in all_images:
-            file_name = img_file.name
-            # Extract experiment name from the file name prefix (before the variable name)
-            if '_' in file_name:
-                # Find the position of the first underscore followed by a common flux variable name
-                common_var_patterns = ['sst_', 'prec_', 'A_']
-                exp_name = file_name
-                for pattern in common_var_patterns:
-                    if pattern in file_name:
-                        exp_name = file_name.split(pattern, 1)[0]
-                        if exp_name.endswith('_'):
-                            exp_name = exp_name[:-1]  # Remove trailing underscore
-                        break
-                experiment_names.add(exp_name)
-        return experiment_names
+        """Extract experiment names from image filenames.
+        
+        The experiment name is the part of the file name before the first
+        common flux variable prefix (sst, prec or A); file names without one
+        are taken as a whole.
+        """
+        matches = ((img_file.name, _EXPERIMENT_NAME_RE.match(img_file.name)) for img_file in all_images)
+        return {match['exp'] if match else file_name
+                for file_name, match in matches if '_' in file_name}
+
+# Plotter of a worker process, set by _init_worker, and its number of processed files
+_WORKER_PLOTTER = None
+_WORKER_FILES = 0
+
+def _init_worker(plotter):
+    """Keep the plotter sent to a new worker process for all its tasks."""
+    global _WORKER_PLOTTER
+    _WORKER_PLOTTER = plotter
+    # The pool already runs one process per core; threaded numba kernels in
+    # every worker would only oversubscribe the CPUs
+    set_num_threads(1)
+
+def _process_file_worker(nc_file, coord_type):
+    """Process a single netCDF file with the plotter of this worker process."""
+    global _WORKER_FILES
+    result = _WORKER_PLOTTER._process_file_impl(nc_file, coord_type)
+    _WORKER_FILES += 1
+    if _WORKER_FILES % _GC_INTERVAL == 0:
+        gc.collect()
+    return result
 
 if __name__ == "__main__":
     # Parse command line arguments
@@ -1221,6 +1832,9 @@ if __name__ == "__main__":
     parser.add_argument('--no-remap', action='store_true', help='Disable remapping to higher resolution')
     parser.add_argument('--sequential', action='store_true', help='Process files sequentially (default: parallel)')
     parser.add_argument('--resolution', type=float, default=0.5, help='Target resolution in degrees (default: 0.5)')
+    parser.add_argument('--interp', choices=['linear', 'fast', 'nearest'], default='linear', help='Remapping method: linear (Delaunay, default), fast (3-nearest-neighbour inverse distance) or nearest (nearest neighbour)')
+    parser.add_argument('--dpi', type=int, default=150, help='Resolution of the saved plots in dots per inch (default: 150)')
+    parser.add_argument('--format', dest='image_format', choices=['png', 'webp'], default='png', help='Image format of the plots: png (default) or webp (faster to encode, smaller files)')
     parser.add_argument('--max-files', type=int, default=0, help='Maximum number of files to process per folder (0 for all)')
     parser.add_argument('--folder', type=str, default='', help='Process only this folder (default: all folders)')
     parser.add_argument('--timestep', type=int, default=1, help='Timestep to process (0-indexed, default: 1)')
@@ -1234,7 +1848,10 @@ if __name__ == "__main__":
         remap_higher_res=not args.no_remap, 
         resolution=args.resolution, 
         parallel=not args.sequential,
-        verbose=args.verbose
+        verbose=args.verbose,
+        interp=args.interp,
+        dpi=args.dpi,
+        image_format=args.image_format
     )
     
     # Keep track of processed folders for HTML comparison
@@ -1264,17 +1881,26 @@ if __name__ == "__main__":
             plotter.process_folder(folder, max_files=args.max_files)
             processed_folders.append(folder)
     
-    # Generate HTML comparison with specified folders
+    # Folders shown in the HTML comparison
     if args.compare:
-        plotter.generate_html(comparison_folders=args.compare)
+        comparison_folders = args.compare
+    elif len(processed_folders) >= 2:
+        comparison_folders = processed_folders[:2]
+    elif len(processed_folders) == 1:
+        # For a single folder, pass just that folder
+        comparison_folders = [processed_folders[0]]
     else:
-        # Use the processed folders for comparison
-        if len(processed_folders) >= 2:
-            plotter.generate_html(comparison_folders=processed_folders[:2])
-        elif len(processed_folders) == 1:
-            # For a single folder, pass just that folder
-            plotter.generate_html(comparison_folders=[processed_folders[0]])
-        else:
-            plotter.generate_html()
+        comparison_folders = None
+    
+    # If every folder shown was processed in full in this run, the images
+    # written in this run are all there is to show, so the image directory
+    # need not be listed; otherwise list it to include images of earlier runs
+    image_files = None
+    if (comparison_folders and args.max_files == 0
+            and set(comparison_folders) <= set(processed_folders)):
+        image_files = plotter.image_files
+    
+    # Generate HTML comparison with specified folders
+    plotter.generate_html(comparison_folders=comparison_folders, image_files=image_files)
     if args.verbose:
         print(f"Comparison HTML generated at: {plotter.output_dir / 'comparison.html'}")